@@ -1,14 +1,29 @@
 """Module that interacts with the notion API"""
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping, TypedDict
 
 import os
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is optional
+    _HAS_ORJSON = False
+    import json
 
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 NOTION_VERSION = "2022-06-28"
@@ -16,6 +31,92 @@ NOTION_API_BASE_URL = "https://api.notion.com"
 NOTION_API_VERSION = "v1"
 NOTION_API_KEY = os.environ.get("NOTION_API_KEY")
 
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+MAX_PAGE_SIZE = 100
+DEFAULT_POOL_MAXSIZE = 20
+DEFAULT_MAX_WORKERS = 8
+
+_API_ROOT = f"{NOTION_API_BASE_URL}/{NOTION_API_VERSION}"
+_BASE_HEADERS = {"Notion-Version": NOTION_VERSION, "Content-Type": "application/json"}
+
+
+def _build_session(
+    pool_connections: int = 4, pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+) -> requests.Session:
+    """[internal] Build a session with connection pooling and retries for
+    rate limit and server errors
+    :param pool_connections: Number of connection pools to cache
+    :param pool_maxsize: Maximum number of connections to keep per pool
+    :return: A session with the invariant notion headers set
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "POST", "PATCH"}),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        ),
+    )
+    session.headers.update(_BASE_HEADERS)
+    return session
+
+
+_SESSION = _build_session()
+
+
+def _debug_enabled() -> bool:
+    """[internal] Check the debug level before building the log arguments,
+    the logger caches the result until the logging configuration changes
+    :return: True when debug records would be handled
+    """
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+def _json_default(value: Any) -> str:
+    """[internal] Serialize datetimes for the stdlib json fallback the same
+    way orjson does (naive as UTC, Z suffix)
+    :param value: Value not serializable by json
+    :return: The value as an ISO 8601 string
+    :raises: TypeError
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat().replace("+00:00", "Z")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(payload: Mapping[str, Any]) -> bytes:
+    """[internal] Serialize a request payload, with orjson when installed
+    :param payload: Payload of the request
+    :return: The payload encoded as JSON bytes
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+    return json.dumps(payload, separators=(",", ":"), default=_json_default).encode()
+
+
+_EMPTY_PAYLOAD = b"{}"
+
+
+def fast_json(res: requests.Response) -> Any:
+    """Parse the body of a response, with orjson when installed. Prefer it to
+    res.json() which detects the encoding and parses with the stdlib json
+    :param res: Response of a notion api call
+    :return: The decoded JSON body
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(res.content)
+    return json.loads(res.content)
+
 
 @dataclass(frozen=True, slots=True, eq=True)
 class NotionPageProperty:
@@ -25,28 +126,91 @@ class NotionPageProperty:
     value: str | int | datetime | float
 
 
+@dataclass(frozen=True, slots=True, eq=True)
+class NotionPropertyBatch:
+    """Class that represent the properties of a page update as parallel
+    names and values, to reuse the names when only the values change"""
+
+    names: tuple[str, ...]
+    values: tuple[str | int | datetime | float, ...]
+
+    def __post_init__(self) -> None:
+        if len(self.names) != len(self.values):
+            raise ValueError("names and values must have the same length")
+
+    @classmethod
+    def from_props(cls, props: list[NotionPageProperty]) -> "NotionPropertyBatch":
+        """Build a batch from a list of properties
+        :param props: List of notion page properties
+        :return: A batch with the names and values of the properties
+        """
+        return cls(tuple(p.name for p in props), tuple(p.value for p in props))
+
+    def with_values(
+        self, values: tuple[str | int | datetime | float, ...]
+    ) -> "NotionPropertyBatch":
+        """Build a batch with the same names and new values
+        :param values: Values in the order of the names
+        :return: A new batch
+        :raises: ValueError
+        """
+        return NotionPropertyBatch(self.names, tuple(values))
+
+
 class SortDirection(Enum):
     "Enum that represents the direction to sort a query"
-    ascending = ("ascending",)
+    ascending = "ascending"
     descending = "descending"
 
     def __str__(self) -> str:
-        return super().__str__().split(".")[-1]
+        return self._value_
+
+
+_DIR_STR = {direction: direction._value_ for direction in SortDirection}
+
+
+class NotionSort(TypedDict):
+    "Sort of a single property in a notion database query"
+    property: str
+    direction: str
+
+
+class NotionSorter(TypedDict):
+    "Sorts of a notion database query"
+    sorts: list[NotionSort]
+
+
+class NotionEquals(TypedDict):
+    "Equals condition of a property filter"
+    equals: str
+
+
+class NotionPropertyFilter(TypedDict, total=False):
+    "Filter of a single property, by date or rich text"
+    property: str
+    date: NotionEquals
+    rich_text: NotionEquals
+
+
+class NotionFilter(TypedDict):
+    "Filter of a notion database query"
+    filter: NotionPropertyFilter
 
 
 def build_single_sorter(
     property_name: str, direction: SortDirection = SortDirection.ascending
-) -> dict:
+) -> NotionSorter:
     """Build a sorter object for a single property
     :param property_name: Name of the property to sort
     :param direction: Direction to sort (ascending - default | descending)
     :return: A dictionary formated for sorting a notion database query
     """
 
-    logger.debug(
-        f"Starting {build_single_sorter.__name__}",
-        {"property_name": property_name, "direction": str(direction)},
-    )
+    if _debug_enabled():
+        logger.debug(
+            "Starting build_single_sorter %r",
+            {"property_name": property_name, "direction": direction},
+        )
 
     if not isinstance(direction, SortDirection):
         raise TypeError("Direction must be an instance of SortDirection")
@@ -54,31 +218,36 @@ def build_single_sorter(
     if not property_name:
         raise ValueError("Property name can't be empty")
 
-    direction = direction or SortDirection.ascending
-
-    sorter = {"sorts": []}
-    sorter["sorts"].append(
-        {
-            "property": property_name,
-            "direction": str(direction),
-        }
-    )
+    sorter: NotionSorter = {
+        "sorts": [{"property": property_name, "direction": _DIR_STR[direction]}]
+    }
 
-    logger.debug(f"Ending {build_single_sorter.__name__}", {"sorter": sorter})
+    if _debug_enabled():
+        logger.debug("Ending build_single_sorter %r", {"sorter": sorter})
     return sorter
 
 
-def build_equal_filter(property_name: str, value: Any) -> dict:
+@lru_cache(maxsize=256)
+def _iso_date(year: int, month: int, day: int) -> str:
+    """[internal] ISO 8601 date, cached since the same dates are filtered
+    repeatedly
+    :return: The date formated as YYYY-MM-DD
+    """
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def build_equal_filter(property_name: str, value: Any) -> NotionFilter:
     """Build a filter for one property (date or str)
     :param property_name: Name of the property to filter
     :param value: Value of the property to filter
     :return: A dictionary formated for filtering a notion database query
-    :raises: ValueError
+    :raises: ValueError, TypeError
     """
-    # TODO: Fix datetime is not serializable
-    # logger.debug(f"Starting {build_equal_filter.__name__}",
-    #              {"property_name": property_name, "value": value})
-    logger.debug(f"Starting {build_equal_filter.__name__}")
+    if _debug_enabled():
+        logger.debug(
+            "Starting build_equal_filter %r",
+            {"property_name": property_name, "value": value},
+        )
 
     if not property_name:
         raise ValueError("Property name can't be empty")
@@ -86,19 +255,23 @@ def build_equal_filter(property_name: str, value: Any) -> dict:
     if not value:
         raise ValueError("Value can't be empty")
 
-    filter = {}
-    filter["filter"] = {}
-    filter["filter"]["property"] = property_name
-
+    filter: NotionFilter
     if isinstance(value, datetime):
-        filter["filter"]["date"] = {}
-        filter["filter"]["date"]["equals"] = value.date().isoformat()
-
-    if isinstance(value, str):
-        filter["filter"]["rich_text"] = {}
-        filter["filter"]["rich_text"]["equals"] = value
+        filter = {
+            "filter": {
+                "property": property_name,
+                "date": {"equals": _iso_date(value.year, value.month, value.day)},
+            }
+        }
+    elif isinstance(value, str):
+        filter = {
+            "filter": {"property": property_name, "rich_text": {"equals": value}}
+        }
+    else:
+        raise TypeError("Value must be a datetime or a str")
 
-    logger.debug(f"Ending {build_equal_filter.__name__}", {"filter": filter})
+    if _debug_enabled():
+        logger.debug("Ending build_equal_filter %r", {"filter": filter})
 
     return filter
 
@@ -110,25 +283,34 @@ def build_update_properties(properties: list[NotionPageProperty]) -> dict:
     :return: Dictionary formated for patching a notion database page
     :raises: ValueError
     """
-    logger.debug(
-        f"Starting {build_update_properties.__name__}",
-        {"properties": list([{p.name: p.value} for p in properties])},
-    )
-
-    if not len(properties):
+    if not properties:
         raise ValueError("properties can't be empty")
 
-    ret = {}
-    ret["properties"] = {}
+    ret = {"properties": {p.name: p.value for p in properties}}
 
-    for notion_propertie in properties:
-        ret["properties"][notion_propertie.name] = notion_propertie.value
+    if _debug_enabled():
+        logger.debug("Ending build_update_properties %r", {"return": ret})
+    return ret
+
+
+def build_update_properties_batch(batch: NotionPropertyBatch) -> dict:
+    """Build a dictionary from a batch of properties to update in a notion
+    database page
+    :param batch: Names and values of the properties to update
+    :return: Dictionary formated for patching a notion database page
+    :raises: ValueError
+    """
+    if not batch.names:
+        raise ValueError("properties can't be empty")
+
+    ret = {"properties": dict(zip(batch.names, batch.values))}
 
-    logger.debug(f"Ending {build_update_properties.__name__}", {"return": ret})
+    if _debug_enabled():
+        logger.debug("Ending build_update_properties_batch %r", {"return": ret})
     return ret
 
 
-def _log_headers(headers: dict) -> dict:
+def _log_headers(headers: Mapping[str, str]) -> dict:
     """[internal] Exclude Authorization Header for log
     :param headers: Original dict headers
     :return: Dict headers without Authorization key
@@ -136,101 +318,516 @@ def _log_headers(headers: dict) -> dict:
     return {key: value for key, value in headers.items() if key != "Authorization"}
 
 
-def build_headers() -> dict:
-    """Build basic headers for requests with api key
-    :return: A dictionary for the headers authorization notion-version
+def build_headers(api_key: str | None = None) -> Mapping[str, str]:
+    """Build basic headers for requests with api key. The headers are cached
+    by api key, NOTION_API_KEY is read on every call
+    :param api_key: Notion api key (default NOTION_API_KEY)
+    :return: A read only mapping for the headers authorization notion-version
     and content-type
     """
-    logger.debug(f"Starting {build_headers.__name__}")
+    return _build_headers(api_key or NOTION_API_KEY)
 
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json",
-    }
 
-    logger.debug(f"Ending {build_headers.__name__}", {"headers": _log_headers(headers)})
+@lru_cache(maxsize=8)
+def _build_headers(api_key: str | None) -> Mapping[str, str]:
+    """[internal] Build the basic headers for an api key, read only since the
+    same mapping is returned to every caller
+    :param api_key: Notion api key
+    :return: A read only mapping with the basic headers
+    """
+    logger.debug("Starting build_headers")
+
+    headers = MappingProxyType({**_BASE_HEADERS, "Authorization": f"Bearer {api_key}"})
+
+    if _debug_enabled():
+        logger.debug("Ending build_headers %r", {"headers": _log_headers(headers)})
 
     return headers
 
 
+def _auth_headers(api_key: str | None = None) -> Mapping[str, str]:
+    """[internal] Build the per request headers, the invariant ones are set in
+    the session
+    :param api_key: Notion api key (default NOTION_API_KEY)
+    :return: A read only mapping with the authorization header
+    """
+    return _build_auth_headers(api_key or NOTION_API_KEY)
+
+
+@lru_cache(maxsize=8)
+def _build_auth_headers(api_key: str | None) -> Mapping[str, str]:
+    """[internal] Authorization header for an api key, cached by api key
+    :param api_key: Notion api key
+    :return: A read only mapping with the authorization header
+    """
+    return MappingProxyType({"Authorization": f"Bearer {api_key}"})
+
+
 def build_url(route: str) -> str:
     """Build a url concatenating notion api base url + api version + a custom
     route
     :return: url encoded for the request
 
     """
-    logger.debug(f"Starting {build_url.__name__}", {"route": route})
+    if _debug_enabled():
+        logger.debug("Starting build_url %r", {"route": route})
 
-    url = "/".join([NOTION_API_BASE_URL, NOTION_API_VERSION, route])
+    url = _API_ROOT + "/" + route
 
-    logger.debug(f"Ending {build_url.__name__}", {"return": url})
+    if _debug_enabled():
+        logger.debug("Ending build_url %r", {"return": url})
 
     return url
 
 
-def query_notion_database(
-    database_id: str, filter: dict = {}, sorter: dict = {}
-) -> requests.Response:
-    """Query a notion database
+@lru_cache(maxsize=256)
+def _query_url(database_id: str) -> str:
+    """[internal] Url to query a notion database, cached by database id
     :param database_id: Id of notion database
-    :result: obj with database pages
-    :raises: ConnectionError, Timeout, HTTPError
+    :return: url of the database query endpoint
     """
-    logger.debug(
-        f"Starting {query_notion_database.__name__}", {"database_id": database_id}
-    )
+    return _API_ROOT + "/databases/" + database_id + "/query"
 
-    if not database_id:
-        raise ValueError(database_id)
 
-    headers = build_headers()
-    payload = filter | sorter
-    databases_api_url = build_url(f"databases/{database_id}/query")
+@lru_cache(maxsize=256)
+def _page_url(page_id: str) -> str:
+    """[internal] Url of a notion page, cached by page id
+    :param page_id: Id of the page
+    :return: url of the page endpoint
+    """
+    return _API_ROOT + "/pages/" + page_id
 
-    logger.info(
-        f"Calling (POST) {databases_api_url}",
-        {"data": payload, "headers": _log_headers(headers)},
-    )
 
-    res = requests.post(databases_api_url, json=payload, headers=headers)
+class NotionClient:
+    """Class that owns a session to reuse the connections to the notion api
+    between calls. Can be used as a context manager to close the session at
+    the end of a batch of calls
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        session: requests.Session | None = None,
+    ) -> None:
+        """
+        :param api_key: Notion api key (default NOTION_API_KEY)
+        :param pool_maxsize: Maximum number of connections to keep in the pool
+        (the pool size of the session when one is given)
+        :param session: Session to use instead of creating a new one
+        """
+        self._api_key = api_key
+        self._pool_maxsize = pool_maxsize
+        self._session = session or _build_session(pool_maxsize=pool_maxsize)
+        self._pending_updates: defaultdict[
+            str, list[NotionPageProperty]
+        ] = defaultdict(list)
+
+    def __enter__(self) -> "NotionClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the session and its pooled connections"""
+        self._session.close()
+
+    def query_database(
+        self,
+        database_id: str,
+        filter: Mapping[str, Any] | None = None,
+        sorter: Mapping[str, Any] | None = None,
+    ) -> requests.Response:
+        """Query a notion database
+        :param database_id: Id of notion database
+        :param filter: Filter built with build_equal_filter
+        :param sorter: Sorter built with build_single_sorter
+        :result: obj with database pages
+        :raises: ConnectionError, Timeout, HTTPError
+        """
+        if _debug_enabled():
+            logger.debug("Starting query_database %r", {"database_id": database_id})
+
+        if not database_id:
+            raise ValueError(database_id)
+
+        headers = _auth_headers(self._api_key)
+        if filter and sorter:
+            data = _dumps({**filter, **sorter})
+        elif filter:
+            data = _dumps(filter)
+        elif sorter:
+            data = _dumps(sorter)
+        else:
+            data = _EMPTY_PAYLOAD
+        databases_api_url = _query_url(database_id)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Calling (POST) %s %r",
+                databases_api_url,
+                {"data": data, "headers": _log_headers(headers)},
+            )
+
+        res = self._session.post(databases_api_url, data=data, headers=headers)
+
+        logger.info("Status code %s", res.status_code)
+
+        res.raise_for_status()
+
+        if _debug_enabled():
+            logger.debug("Ending query_database %r", {"res": fast_json(res)})
+        return res
+
+    def iter_database(
+        self,
+        database_id: str,
+        filter: Mapping[str, Any] | None = None,
+        sorter: Mapping[str, Any] | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> Iterator[dict]:
+        """Iterate over all the pages of a notion database, following the
+        query cursor until there are no more results
+        :param database_id: Id of notion database
+        :param filter: Filter built with build_equal_filter
+        :param sorter: Sorter built with build_single_sorter
+        :param page_size: Number of pages by request (1 to 100)
+        :return: An iterator over the database pages
+        :raises: ValueError, ConnectionError, Timeout, HTTPError
+        """
+        if _debug_enabled():
+            logger.debug("Starting iter_database %r", {"database_id": database_id})
+
+        if not database_id:
+            raise ValueError(database_id)
+
+        if not 0 < page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+
+        payload = {**(filter or {}), **(sorter or {}), "page_size": page_size}
+        return self._iter_database(database_id, payload)
+
+    def _iter_database(self, database_id: str, payload: dict) -> Iterator[dict]:
+        """[internal] Generator behind iter_database, split out so the
+        arguments are validated when iter_database is called
+        :param database_id: Id of notion database
+        :param payload: Query payload, the cursor is updated in place
+        :return: An iterator over the database pages
+        :raises: ConnectionError, Timeout, HTTPError
+        """
+        headers = _auth_headers(self._api_key)
+        databases_api_url = _query_url(database_id)
+
+        while True:
+            logger.info("Calling (POST) %s %r", databases_api_url, payload)
+
+            res = self._session.post(
+                databases_api_url, data=_dumps(payload), headers=headers
+            )
+
+            logger.info("Status code %s", res.status_code)
+
+            res.raise_for_status()
+
+            body = fast_json(res)
+            yield from body["results"]
+
+            if not body["has_more"]:
+                break
+
+            payload["start_cursor"] = body["next_cursor"]
+
+        if _debug_enabled():
+            logger.debug("Ending iter_database %r", {"database_id": database_id})
+
+    def update_page(
+        self,
+        page_id: str,
+        properties: list[NotionPageProperty] | NotionPropertyBatch,
+    ) -> requests.Response:
+        """Update a page entry in notion
+        :param page_id: Id of the page to update
+        :param properties: A list or a batch of properties to update with name
+        e value
+        :return: A response object
+        :raises: ValueError, ConnectionError, Timeout, HTTPError
+        """
+
+        if _debug_enabled():
+            logger.debug("Starting update_page %r", {"page_id": page_id})
+
+        if not page_id:
+            raise ValueError(page_id)
+
+        url = _page_url(page_id)
+        if isinstance(properties, NotionPropertyBatch):
+            payload = build_update_properties_batch(properties)
+        else:
+            payload = build_update_properties(properties)
+        headers = _auth_headers(self._api_key)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Calling (PATCH) %s %r",
+                url,
+                {"data": payload, "headers": _log_headers(headers)},
+            )
+
+        res = self._session.patch(url, data=_dumps(payload), headers=headers)
+
+        logger.info("Status code %s", res.status_code)
+
+        res.raise_for_status()
+
+        if _debug_enabled():
+            logger.debug(
+                "Ending update_page %r", {"return": {"status_code": res.status_code}}
+            )
+        return res
+
+    def update_pages(
+        self,
+        page_updates: dict[str, list[NotionPageProperty] | NotionPropertyBatch],
+    ) -> dict[str, requests.Response]:
+        """Update many pages with a single PATCH per page
+        :param page_updates: Properties (list or batch) to update grouped by page id
+        :return: The response of each page by page id
+        :raises: ConnectionError, Timeout, HTTPError
+        """
+        return {
+            page_id: self.update_page(page_id, properties)
+            for page_id, properties in page_updates.items()
+        }
+
+    def queue_update(self, page_id: str, page_property: NotionPageProperty) -> None:
+        """Queue a property update to be sent with flush_updates
+        :param page_id: Id of the page to update
+        :param page_property: Property to update with name e value
+        """
+        self._pending_updates[page_id].append(page_property)
+
+    def flush_updates(self) -> dict[str, requests.Response]:
+        """Send the queued property updates, one PATCH per page. When a PATCH
+        fails its page is queued again after the pages not sent yet, so the
+        next flush retries it without blocking the others
+        :return: The response of each page by page id
+        :raises: ConnectionError, Timeout, HTTPError
+        """
+        responses = {}
+        while self._pending_updates:
+            page_id = next(iter(self._pending_updates))
+            properties = self._pending_updates.pop(page_id)
+            try:
+                responses[page_id] = self.update_page(page_id, properties)
+            except Exception:
+                queued = self._pending_updates.pop(page_id, [])
+                self._pending_updates[page_id] = properties + queued
+                raise
+        return responses
+
+    def _map_parallel(
+        self, fn: Callable[..., Any], args_list: list[tuple], max_workers: int
+    ) -> list:
+        """[internal] Call fn for each args in a thread pool sharing the session.
+        The workers are capped to the pool size so connections are not evicted
+        :param fn: Function to call
+        :param args_list: Positional arguments of each call
+        :param max_workers: Maximum number of threads
+        :return: The results in the order of args_list
+        """
+        max_workers = min(max_workers, self._pool_maxsize)
+        results: list = [None] * len(args_list)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(fn, *args): index
+                for index, args in enumerate(args_list)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+
+    def update_pages_parallel(
+        self,
+        items: list[tuple[str, list[NotionPageProperty] | NotionPropertyBatch]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[requests.Response]:
+        """Update many pages concurrently, one PATCH per item
+        :param items: Page ids with the properties (list or batch) to update
+        :param max_workers: Maximum number of concurrent requests
+        :return: The responses in the order of items
+        :raises: ConnectionError, Timeout, HTTPError
+        """
+        return self._map_parallel(self.update_page, items, max_workers)
+
+    def query_databases_parallel(
+        self,
+        database_ids: list[str],
+        filter: Mapping[str, Any] | None = None,
+        sorter: Mapping[str, Any] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[requests.Response]:
+        """Query many databases concurrently with the same filter and sorter
+        :param database_ids: Ids of the notion databases
+        :param filter: Filter built with build_equal_filter
+        :param sorter: Sorter built with build_single_sorter
+        :param max_workers: Maximum number of concurrent requests
+        :return: The responses in the order of database_ids
+        :raises: ValueError, ConnectionError, Timeout, HTTPError
+        """
+        return self._map_parallel(
+            self.query_database,
+            [(database_id, filter, sorter) for database_id in database_ids],
+            max_workers,
+        )
+
+
+_DEFAULT_CLIENT = NotionClient(session=_SESSION)
+
+
+def _default_client() -> NotionClient:
+    """[internal] Client shared by the module level functions, built at import
+    so concurrent callers always get the same instance
+    :return: A client using the module session
+    """
+    return _DEFAULT_CLIENT
+
+
+def _client(api_key: str | None = None) -> NotionClient:
+    """[internal] Get a client for the module session with a custom api key
+    :param api_key: Notion api key (default NOTION_API_KEY)
+    :return: The default client or a new client sharing the module session
+    """
+    if api_key is None:
+        return _default_client()
+    return NotionClient(api_key=api_key, session=_SESSION)
+
 
-    logger.info(f"Status code {res.status_code}", {"status_code": res.status_code})
+def query_notion_database(
+    database_id: str,
+    filter: Mapping[str, Any] | None = None,
+    sorter: Mapping[str, Any] | None = None,
+) -> requests.Response:
+    """Query a notion database with the default client
+    :param database_id: Id of notion database
+    :param filter: Filter built with build_equal_filter
+    :param sorter: Sorter built with build_single_sorter
+    :result: obj with database pages
+    :raises: ConnectionError, Timeout, HTTPError
+    """
+    return _default_client().query_database(database_id, filter, sorter)
+
+
+def iter_database_pages(
+    database_id: str,
+    filter: Mapping[str, Any] | None = None,
+    sorter: Mapping[str, Any] | None = None,
+    page_size: int = MAX_PAGE_SIZE,
+    api_key: str | None = None,
+) -> Iterator[dict]:
+    """Iterate over all the pages of a notion database, one request per
+    page_size pages
+    :param database_id: Id of notion database
+    :param filter: Filter built with build_equal_filter
+    :param sorter: Sorter built with build_single_sorter
+    :param page_size: Number of pages by request (1 to 100)
+    :param api_key: Notion api key (default NOTION_API_KEY)
+    :return: An iterator over the database pages
+    :raises: ValueError, ConnectionError, Timeout, HTTPError
+    """
+    return _client(api_key).iter_database(database_id, filter, sorter, page_size)
 
-    res.raise_for_status()
 
-    logger.debug(f"Ending {query_notion_database.__name__}", {"res": res.json()})
-    return res
+def query_notion_database_all(
+    database_id: str,
+    filter: Mapping[str, Any] | None = None,
+    sorter: Mapping[str, Any] | None = None,
+    api_key: str | None = None,
+) -> list[dict]:
+    """Query all the pages of a notion database
+    :param database_id: Id of notion database
+    :param filter: Filter built with build_equal_filter
+    :param sorter: Sorter built with build_single_sorter
+    :param api_key: Notion api key (default NOTION_API_KEY)
+    :return: A list with all the database pages
+    :raises: ValueError, ConnectionError, Timeout, HTTPError
+    """
+    return list(iter_database_pages(database_id, filter, sorter, api_key=api_key))
 
 
 def update_notion_page(
-    page_id: str, properties: list[NotionPageProperty]
+    page_id: str, properties: list[NotionPageProperty] | NotionPropertyBatch
 ) -> requests.Response:
-    """Update a page entry in notion
+    """Update a page entry in notion with the default client
     :param page_id: Id of the page to update
-    :param properties: A list of properties to update with name e value
+    :param properties: A list or a batch of properties to update with name e
+    value
     :return: A response object
     :raises: ConnectionError, Timeout, HTTPError
     """
+    return _default_client().update_page(page_id, properties)
 
-    logger.debug(f"Starting {update_notion_page.__name__}", {"page_id": page_id})
-
-    url = build_url(f"pages/{page_id}")
-    payload = build_update_properties(properties)
-    headers = build_headers()
 
-    logger.info(
-        f"Calling (PATCH) {url}", {"data": payload, "headers": _log_headers(headers)}
-    )
+def update_notion_page_many(
+    page_updates: dict[str, list[NotionPageProperty] | NotionPropertyBatch],
+    api_key: str | None = None,
+) -> dict[str, requests.Response]:
+    """Update many pages in notion with a single PATCH per page
+    :param page_updates: Properties (list or batch) to update grouped by page id
+    :param api_key: Notion api key (default NOTION_API_KEY)
+    :return: The response of each page by page id
+    :raises: ConnectionError, Timeout, HTTPError
+    """
+    return _client(api_key).update_pages(page_updates)
 
-    res = requests.patch(url, json=payload, headers=headers)
 
-    logger.info(f"Status code {res.status_code}", {"status_code": res.status_code})
+def queue_page_update(page_id: str, page_property: NotionPageProperty) -> None:
+    """Queue a property update in the default client
+    :param page_id: Id of the page to update
+    :param page_property: Property to update with name e value
+    """
+    _default_client().queue_update(page_id, page_property)
 
-    res.raise_for_status()
 
-    logger.debug(
-        f"Ending {update_notion_page.__name__}",
-        {"return": {"status_code": res.status_code}},
+def flush_pending_updates() -> dict[str, requests.Response]:
+    """Send the property updates queued in the default client
+    :return: The response of each page by page id
+    :raises: ConnectionError, Timeout, HTTPError
+    """
+    return _default_client().flush_updates()
+
+
+def update_notion_pages_parallel(
+    items: list[tuple[str, list[NotionPageProperty] | NotionPropertyBatch]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    api_key: str | None = None,
+) -> list[requests.Response]:
+    """Update many pages in notion concurrently over the module session
+    :param items: Page ids with the properties (list or batch) to update
+    :param max_workers: Maximum number of concurrent requests
+    :param api_key: Notion api key (default NOTION_API_KEY)
+    :return: The responses in the order of items
+    :raises: ConnectionError, Timeout, HTTPError
+    """
+    return _client(api_key).update_pages_parallel(items, max_workers)
+
+
+def query_notion_databases_parallel(
+    database_ids: list[str],
+    filter: Mapping[str, Any] | None = None,
+    sorter: Mapping[str, Any] | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    api_key: str | None = None,
+) -> list[requests.Response]:
+    """Query many notion databases concurrently over the module session
+    :param database_ids: Ids of the notion databases
+    :param filter: Filter built with build_equal_filter
+    :param sorter: Sorter built with build_single_sorter
+    :param max_workers: Maximum number of concurrent requests
+    :param api_key: Notion api key (default NOTION_API_KEY)
+    :return: The responses in the order of database_ids
+    :raises: ValueError, ConnectionError, Timeout, HTTPError
+    """
+    return _client(api_key).query_databases_parallel(
+        database_ids, filter, sorter, max_workers
     )
-    return res
@@ -1,4 +1,7 @@
+import json
+import logging
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import patch, Mock
 from requests import Response
@@ -6,13 +9,29 @@ from requests.exceptions import ConnectionError, Timeout, HTTPError
 from typing import Any
 
 from pynotion import (
+    NotionClient,
     NotionPageProperty,
+    NotionPropertyBatch,
     SortDirection,
     build_single_sorter,
     build_update_properties,
+    build_update_properties_batch,
     query_notion_database,
+    query_notion_database_all,
+    iter_database_pages,
     update_notion_page,
+    update_notion_page_many,
+    update_notion_pages_parallel,
+    query_notion_databases_parallel,
+    queue_page_update,
+    flush_pending_updates,
     build_equal_filter,
+    build_headers,
+    build_url,
+    fast_json,
+    _SESSION,
+    _default_client,
+    _dumps,
 )
 
 
@@ -20,10 +39,29 @@ from pynotion import (
 def query_response():
     response = Mock(Response)
     response.status_code = 200
-    response.json.return_value = {}
+    response.content = b"{}"
     yield response
 
 
+@pytest.fixture(scope="module")
+def cached_response():
+    yield Mock(Response)
+
+
+@pytest.fixture
+def response_factory(cached_response):
+    def make(status_code, body=b"{}"):
+        cached_response.reset_mock(return_value=True, side_effect=True)
+        cached_response.status_code = status_code
+        cached_response.content = body
+        cached_response.json.return_value = json.loads(body)
+        if status_code >= 400:
+            cached_response.raise_for_status.side_effect = HTTPError()
+        return cached_response
+
+    yield make
+
+
 @pytest.fixture(scope="module")
 def api_key():
     yield "test_key"
@@ -76,6 +114,11 @@ def headers(api_key, notion_version):
     }
 
 
+@pytest.fixture(scope="module")
+def auth_headers(api_key):
+    yield {"Authorization": f"Bearer {api_key}"}
+
+
 @pytest.fixture
 def filter():
     yield {"filter": {"property": "Habit", "rich_text": {"equals": "teste"}}}
@@ -91,7 +134,7 @@ def update_one_property():
     yield [NotionPageProperty("name", "value")]
 
 
-@patch("pynotion.requests.post")
+@patch("pynotion._SESSION.post")
 @patch("pynotion.NOTION_VERSION", "2022-06-28")
 @patch("pynotion.NOTION_API_BASE_URL", "https://api.notion.com")
 @patch("pynotion.NOTION_API_KEY", "test_key")
@@ -101,7 +144,7 @@ def test_when_success_post_callled_with_right_arguments(
     query_response,
     database_id,
     query_database_url,
-    headers,
+    auth_headers,
     filter,
     sorter,
 ) -> None:
@@ -115,17 +158,37 @@ def test_when_success_post_callled_with_right_arguments(
     # Assert
     post_request.assert_called_once_with(
         query_database_url,
-        json=data,
-        headers=headers
+        data=_dumps(data),
+        headers=auth_headers
     )
 
 
-@patch("pynotion.requests.post")
-def test_query_database_success(post_request, database_id):
+@patch("pynotion._SESSION.post")
+@pytest.mark.parametrize(
+    "use_filter, use_sorter, expected",
+    [
+        (False, False, {}),
+        (True, False, {"filter": {"property": "Habit"}}),
+        (False, True, {"sorts": []}),
+        (True, True, {"filter": {"property": "Habit"}, "sorts": []}),
+    ],
+)
+def test_query_database_optional_filter_and_sorter(
+    post_request, query_response, database_id, use_filter, use_sorter, expected
+):
+    post_request.return_value = query_response
+    filter = {"filter": {"property": "Habit"}} if use_filter else None
+    sorter = {"sorts": []} if use_sorter else None
+
+    query_notion_database(database_id, filter, sorter)
+
+    assert json.loads(post_request.call_args.kwargs["data"]) == expected
+
+
+@patch("pynotion._SESSION.post")
+def test_query_database_success(post_request, database_id, response_factory):
     # Arrange
-    query_response = Response()
-    query_response.status_code = 200
-    query_response._content = b"{}"
+    query_response = response_factory(200)
     post_request.return_value = query_response
 
     # Act
@@ -136,7 +199,7 @@ def test_query_database_success(post_request, database_id):
     assert res.status_code == 200
 
 
-@patch("pynotion.requests.post")
+@patch("pynotion._SESSION.post")
 @pytest.mark.parametrize("database_id", [(""), (None)])
 def test_databaseid_not_empty(post_request, query_response, database_id):
     post_request.return_value = query_response
@@ -144,25 +207,26 @@ def test_databaseid_not_empty(post_request, query_response, database_id):
         query_notion_database(database_id)
 
 
-@patch("pynotion.requests.post")
+@patch("pynotion._SESSION.post")
 def test_query_database_connection_error(post_request, database_id):
     post_request.side_effect = ConnectionError()
     with pytest.raises(ConnectionError):
         query_notion_database(database_id)
 
 
-@patch("pynotion.requests.post")
+@patch("pynotion._SESSION.post")
 def test_query_database_timeout_error(post_request, database_id):
     post_request.side_effect = Timeout()
     with pytest.raises(Timeout):
         query_notion_database(database_id)
 
 
-@patch("pynotion.requests.post")
+@patch("pynotion._SESSION.post")
 @pytest.mark.parametrize("status_code", [(400), (500)])
-def test_query_database_http_error(post_request, database_id, status_code):
-    query_response = Response()
-    query_response.status_code = status_code
+def test_query_database_http_error(
+    post_request, database_id, status_code, response_factory
+):
+    query_response = response_factory(status_code)
     post_request.return_value = query_response
 
     with pytest.raises(HTTPError):
@@ -180,6 +244,12 @@ def test_build_date_equal_database_filter():
     assert result["filter"]["date"]["equals"] == date.date().isoformat()
 
 
+def test_build_date_equal_filter_pads_date():
+    result = build_equal_filter("Date", datetime(987, 1, 2, 23, 59))
+
+    assert result["filter"]["date"]["equals"] == "0987-01-02"
+
+
 def test_build_str_equal_database_filter():
     property_name = "Habit"
     value = "No Suggar"
@@ -191,6 +261,12 @@ def test_build_str_equal_database_filter():
     assert result["filter"]["rich_text"]["equals"] == value
 
 
+@pytest.mark.parametrize("value", [1, 2.5, ["teste"]])
+def test_build_equal_filter_unsupported_value(value: Any):
+    with pytest.raises(TypeError):
+        build_equal_filter("Propertie", value)
+
+
 @pytest.mark.parametrize("value", [None, "", 0])
 def test_build_equal_filter_empty_value(value: Any):
     property_name = "Propertie"
@@ -205,6 +281,46 @@ def test_build_equal_filter_empty_property_name(property_name: Any):
         build_equal_filter(property_name, "teste")
 
 
+def test_build_headers_with_api_key(headers, api_key):
+    assert build_headers(api_key) == headers
+
+
+@patch("pynotion.NOTION_API_KEY", "test_key")
+def test_build_headers_default_api_key(headers):
+    assert build_headers() == headers
+
+
+def test_build_headers_cached_and_read_only(api_key):
+    headers = build_headers(api_key)
+
+    assert build_headers(api_key) is headers
+    with pytest.raises(TypeError):
+        headers["Authorization"] = "Bearer other_key"
+
+
+def test_build_headers_follows_api_key_changes():
+    with patch("pynotion.NOTION_API_KEY", "first_key"):
+        assert build_headers()["Authorization"] == "Bearer first_key"
+    with patch("pynotion.NOTION_API_KEY", "second_key"):
+        assert build_headers()["Authorization"] == "Bearer second_key"
+
+
+def test_build_url(update_page_url, page_id):
+    assert build_url(f"pages/{page_id}") == update_page_url
+
+
+def test_session_has_invariant_headers(notion_version):
+    assert _SESSION.headers["Notion-Version"] == notion_version
+    assert _SESSION.headers["Content-Type"] == "application/json"
+    assert "Authorization" not in _SESSION.headers
+
+
+def test_session_accepts_brotli_when_installed():
+    pytest.importorskip("brotli")
+
+    assert "br" in _SESSION.headers["Accept-Encoding"]
+
+
 @pytest.mark.parametrize(
     "property_name, direction, expected_direction",
     [
@@ -221,6 +337,15 @@ def test_build_single_sorter(property_name, direction, expected_direction):
     assert sorter["sorts"][0]["direction"] == expected_direction
 
 
+@pytest.mark.parametrize(
+    "direction, expected",
+    [(SortDirection.ascending, "ascending"), (SortDirection.descending, "descending")],
+)
+def test_sort_direction_str(direction, expected):
+    assert direction.value == expected
+    assert str(direction) == expected
+
+
 @pytest.mark.parametrize("direction", ["", None, 1, 3.3])
 def test_build_single_sorter_direction_not_sortdirection(direction):
     with pytest.raises(TypeError):
@@ -249,37 +374,61 @@ def test_build_update_properties_one_propertie():
     assert properties["properties"][property_name] == property_value
 
 
-@patch("pynotion.requests.patch")
+def test_build_update_properties_batch_same_as_list():
+    properties = [NotionPageProperty("Streak", 1), NotionPageProperty("Name", "a")]
+    batch = NotionPropertyBatch.from_props(properties)
+
+    assert batch.names == ("Streak", "Name")
+    assert build_update_properties_batch(batch) == build_update_properties(properties)
+
+
+def test_property_batch_with_values():
+    batch = NotionPropertyBatch(("Streak", "Name"), (1, "a"))
+
+    properties = build_update_properties_batch(batch.with_values((2, "b")))
+
+    assert properties == {"properties": {"Streak": 2, "Name": "b"}}
+
+
+def test_property_batch_length_mismatch():
+    with pytest.raises(ValueError):
+        NotionPropertyBatch(("Streak", "Name"), (1,))
+
+
+def test_build_update_properties_batch_empty():
+    with pytest.raises(ValueError):
+        build_update_properties_batch(NotionPropertyBatch((), ()))
+
+
+@patch("pynotion._SESSION.patch")
 @patch("pynotion.NOTION_VERSION", "2022-06-28")
 @patch("pynotion.NOTION_API_BASE_URL", "https://api.notion.com")
 @patch("pynotion.NOTION_API_KEY", "test_key")
 @patch("pynotion.NOTION_API_VERSION", "v1")
 def test_update_database_page_patch_called_with_right_arguments(
-    patch_request, page_id, headers, update_page_url
+    patch_request, page_id, auth_headers, update_page_url, response_factory
 ):
-    patch_response = Response()
-    patch_response.status_code = 200
+    patch_response = response_factory(200)
     patch_request.return_value = patch_response
     properties = [NotionPageProperty("name", "value")]
-    json = build_update_properties(properties)
+    payload = build_update_properties(properties)
 
     update_notion_page(page_id, properties)
 
     patch_request.assert_called_once_with(
         update_page_url,
-        headers=headers,
-        json=json
+        headers=auth_headers,
+        data=_dumps(payload)
     )
 
 
-@patch("pynotion.requests.patch")
+@patch("pynotion._SESSION.patch")
 @patch("pynotion.NOTION_VERSION", "2022-06-28")
 @patch("pynotion.NOTION_API_BASE_URL", "https://api.notion.com")
 @patch("pynotion.NOTION_API_KEY", "test_key")
 @patch("pynotion.NOTION_API_VERSION", "v1")
-def test_update_database_page_success(patch_request, page_id):
-    patch_response = Response()
-    patch_response.status_code = 200
+def test_update_database_page_success(patch_request, page_id, response_factory):
+    patch_response = response_factory(200)
     patch_request.return_value = patch_response
     properties = [NotionPageProperty("name", "value")]
 
@@ -288,7 +437,16 @@ def test_update_database_page_success(patch_request, page_id):
     assert response.status_code == 200
 
 
-@patch("pynotion.requests.patch")
+@patch("pynotion._SESSION.patch")
+@pytest.mark.parametrize("page_id", ["", None])
+def test_update_page_id_not_empty(patch_request, page_id, update_one_property):
+    with pytest.raises(ValueError):
+        update_notion_page(page_id, update_one_property)
+
+    patch_request.assert_not_called()
+
+
+@patch("pynotion._SESSION.patch")
 def test_update_page_connection_error(
     patch_request,
     page_id,
@@ -299,7 +457,7 @@ def test_update_page_connection_error(
         update_notion_page(page_id, update_one_property)
 
 
-@patch("pynotion.requests.patch")
+@patch("pynotion._SESSION.patch")
 def test_update_page_timeout_error(
     patch_request,
     page_id,
@@ -310,14 +468,296 @@ def test_update_page_timeout_error(
         update_notion_page(page_id, update_one_property)
 
 
-@patch("pynotion.requests.patch")
+@patch("pynotion._SESSION.patch")
 @pytest.mark.parametrize("status_code", [400, 404, 429, 500])
 def test_update_page_http_error(
-    patch_request, page_id, update_one_property, status_code
+    patch_request, page_id, update_one_property, status_code, response_factory
 ):
-    query_response = Response()
-    query_response.status_code = status_code
+    query_response = response_factory(status_code)
     patch_request.return_value = query_response
 
     with pytest.raises(HTTPError):
         update_notion_page(page_id, update_one_property)
+
+
+@patch("pynotion.NOTION_API_KEY", "test_key")
+def test_client_query_database_uses_own_session_and_key(
+    query_response, database_id, query_database_url
+):
+    session = Mock()
+    session.post.return_value = query_response
+    client = NotionClient(api_key="client_key", session=session)
+
+    client.query_database(database_id)
+
+    session.post.assert_called_once_with(
+        query_database_url,
+        data=_dumps({}),
+        headers={"Authorization": "Bearer client_key"}
+    )
+
+
+def test_client_update_page_uses_own_session(
+    query_response, page_id, update_page_url, auth_headers, update_one_property
+):
+    session = Mock()
+    session.patch.return_value = query_response
+    client = NotionClient(api_key="test_key", session=session)
+
+    client.update_page(page_id, update_one_property)
+
+    session.patch.assert_called_once_with(
+        update_page_url,
+        data=_dumps(build_update_properties(update_one_property)),
+        headers=auth_headers
+    )
+
+
+def test_client_context_manager_closes_session():
+    session = Mock()
+
+    with NotionClient(session=session) as client:
+        assert isinstance(client, NotionClient)
+
+    session.close.assert_called_once()
+
+
+def test_build_update_properties_last_value_wins():
+    properties = build_update_properties(
+        [NotionPageProperty("Streak", 1), NotionPageProperty("Streak", 2)]
+    )
+
+    assert properties == {"properties": {"Streak": 2}}
+
+
+@patch("pynotion._SESSION.patch")
+def test_update_page_many_one_patch_per_page(patch_request, query_response):
+    patch_request.return_value = query_response
+    page_updates = {
+        "page_1": [NotionPageProperty("a", 1), NotionPageProperty("b", 2)],
+        "page_2": [NotionPageProperty("a", 3)],
+    }
+
+    responses = update_notion_page_many(page_updates, api_key="test_key")
+
+    assert patch_request.call_count == 2
+    assert set(responses) == {"page_1", "page_2"}
+    assert json.loads(patch_request.call_args_list[0].kwargs["data"]) == {
+        "properties": {"a": 1, "b": 2}
+    }
+
+
+@patch("pynotion._SESSION.patch")
+def test_flush_updates_partial_failure(patch_request, query_response, response_factory):
+    error_response = response_factory(404)
+    patch_request.side_effect = [
+        query_response,
+        error_response,
+        query_response,
+        query_response,
+    ]
+    client = NotionClient(api_key="test_key", session=_SESSION)
+    for page in ("good", "bad", "later"):
+        client.queue_update(page, NotionPageProperty("a", 1))
+
+    with pytest.raises(HTTPError):
+        client.flush_updates()
+
+    assert list(client._pending_updates) == ["later", "bad"]
+    assert client._pending_updates["bad"] == [NotionPageProperty("a", 1)]
+
+    responses = client.flush_updates()
+
+    sent = [c.args[0].rsplit("/", 1)[-1] for c in patch_request.call_args_list]
+    assert sent == ["good", "bad", "later", "bad"]
+    assert set(responses) == {"later", "bad"}
+    assert client.flush_updates() == {}
+
+
+@patch("pynotion._SESSION.patch")
+def test_flush_pending_updates_merges_queued_properties(
+    patch_request, query_response, page_id
+):
+    patch_request.return_value = query_response
+    queue_page_update(page_id, NotionPageProperty("a", 1))
+    queue_page_update(page_id, NotionPageProperty("b", 2))
+
+    flush_pending_updates()
+    flush_pending_updates()
+
+    patch_request.assert_called_once()
+    assert json.loads(patch_request.call_args.kwargs["data"]) == {
+        "properties": {"a": 1, "b": 2}
+    }
+
+
+@patch("pynotion.fast_json")
+@patch("pynotion._SESSION.post")
+def test_query_database_skips_response_parse_without_debug(
+    post_request, parse_json, query_response, database_id, caplog
+):
+    post_request.return_value = query_response
+
+    with caplog.at_level(logging.INFO, logger="pynotion"):
+        query_notion_database(database_id)
+
+    parse_json.assert_not_called()
+    query_response.json.assert_not_called()
+
+
+@patch("pynotion._SESSION.post")
+def test_query_database_debug_log(post_request, query_response, database_id, caplog):
+    post_request.return_value = query_response
+
+    with caplog.at_level(logging.DEBUG, logger="pynotion"):
+        query_notion_database(database_id)
+
+    assert "Ending query_database {'res': {}}" in caplog.messages
+
+
+def test_dumps_serializes_naive_datetime_as_utc():
+    payload = {"properties": {"Date": datetime(2023, 4, 29, 10, 30)}}
+
+    assert json.loads(_dumps(payload)) == {
+        "properties": {"Date": "2023-04-29T10:30:00Z"}
+    }
+
+
+def paginated_response(results, next_cursor=None):
+    response = Mock(Response)
+    response.status_code = 200
+    response.content = json.dumps(
+        {
+            "results": results,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
+        }
+    ).encode()
+    return response
+
+
+@patch("pynotion._SESSION.post")
+def test_query_database_all_follows_cursor(post_request, database_id, sorter):
+    post_request.side_effect = [
+        paginated_response([{"id": "1"}, {"id": "2"}], next_cursor="cursor"),
+        paginated_response([{"id": "3"}]),
+    ]
+
+    pages = query_notion_database_all(database_id, sorter=sorter)
+
+    assert pages == [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+    first, second = (json.loads(c.kwargs["data"]) for c in post_request.call_args_list)
+    assert first == sorter | {"page_size": 100}
+    assert second == sorter | {"page_size": 100, "start_cursor": "cursor"}
+
+
+@patch("pynotion._SESSION.post")
+@pytest.mark.parametrize("page_size", [0, 101])
+def test_iter_database_pages_invalid_page_size(post_request, database_id, page_size):
+    with pytest.raises(ValueError):
+        iter_database_pages(database_id, page_size=page_size)
+
+    post_request.assert_not_called()
+
+
+@patch("pynotion._SESSION.post")
+@pytest.mark.parametrize("database_id", ["", None])
+def test_iter_database_pages_databaseid_not_empty(post_request, database_id):
+    with pytest.raises(ValueError):
+        iter_database_pages(database_id)
+
+    post_request.assert_not_called()
+
+
+def test_fast_json():
+    response = Response()
+    response._content = b'{"results": [{"id": "1"}], "has_more": false}'
+
+    assert fast_json(response) == {"results": [{"id": "1"}], "has_more": False}
+
+
+def test_default_client_shared_between_threads():
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: _default_client(), range(32)))
+
+    assert all(client is clients[0] for client in clients)
+    assert clients[0]._session is _SESSION
+
+
+@patch("pynotion._SESSION.patch")
+def test_update_pages_parallel_keeps_order(patch_request):
+    def patch_response(url, **kwargs):
+        response = Mock(Response)
+        response.status_code = 200
+        response.url = url
+        return response
+
+    patch_request.side_effect = patch_response
+    items = [(f"page_{i}", [NotionPageProperty("a", i)]) for i in range(10)]
+
+    responses = update_notion_pages_parallel(items, max_workers=4)
+
+    assert patch_request.call_count == 10
+    assert [r.url.rsplit("/", 1)[-1] for r in responses] == [i for i, _ in items]
+
+
+@patch("pynotion._SESSION.post")
+def test_query_databases_parallel_raises_http_error(post_request, query_response):
+    error_response = Mock(Response)
+    error_response.status_code = 500
+    error_response.raise_for_status.side_effect = HTTPError()
+    post_request.side_effect = [query_response, error_response]
+
+    with pytest.raises(HTTPError):
+        query_notion_databases_parallel(["db_1", "db_2"], max_workers=1)
+
+
+def test_logger_has_null_handler_and_propagates():
+    logger = logging.getLogger("pynotion")
+
+    assert any(isinstance(h, logging.NullHandler) for h in logger.handlers)
+    assert logger.propagate
+
+
+@patch("pynotion._SESSION.patch")
+def test_update_page_with_property_batch(patch_request, query_response, page_id):
+    patch_request.return_value = query_response
+
+    update_notion_page(page_id, NotionPropertyBatch(("Streak",), (3,)))
+
+    assert json.loads(patch_request.call_args.kwargs["data"]) == {
+        "properties": {"Streak": 3}
+    }
+
+
+@patch("pynotion._SESSION.post")
+def test_query_with_builder_output(post_request: Mock, database_id: str) -> None:
+    post_request.return_value = paginated_response([])
+    filter = build_equal_filter("Date", datetime(2023, 4, 29))
+    sorter = build_single_sorter("Date", SortDirection.descending)
+
+    query_notion_database(database_id, filter, sorter)
+    list(iter_database_pages(database_id, filter=filter, sorter=sorter))
+
+    assert json.loads(post_request.call_args_list[0].kwargs["data"]) == {
+        **filter,
+        **sorter,
+    }
+
+
+@patch("pynotion._SESSION.patch")
+def test_bulk_updates_with_property_batch(
+    patch_request: Mock, query_response: Mock
+) -> None:
+    patch_request.return_value = query_response
+    batch = NotionPropertyBatch(("Streak",), (1,))
+    page_updates: dict[str, list[NotionPageProperty] | NotionPropertyBatch] = {
+        "page_1": batch,
+        "page_2": batch.with_values((2,)),
+    }
+
+    update_notion_page_many(page_updates)
+    update_notion_pages_parallel(list(page_updates.items()), max_workers=1)
+
+    payloads = [json.loads(c.kwargs["data"]) for c in patch_request.call_args_list]
+    assert payloads == [{"properties": {"Streak": value}} for value in (1, 2, 1, 2)]